@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""pytest configuration for the docker-explorer tests.
+
+The storage test suites point a shared test_data/docker symlink at the
+extraction of the archive they exercise, which is not safe when test classes
+run concurrently. When running under pytest-xdist (ie: 'pytest -n auto
+--dist loadscope tests.py vhdx_tests.py'), each worker is moved into a
+private working directory with the fixture archives symlinked in, so the
+classes can extract and relink without stepping on each other.
+"""
+
+import os
+import shutil
+import tempfile
+
+_WORKER_STATE = {}
+
+
+def pytest_configure(config):
+  """Gives each pytest-xdist worker a private working directory."""
+  del config  # Unused.
+  worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+  if not worker_id:
+    return
+  source_test_data = os.path.abspath('test_data')
+  worker_directory = tempfile.mkdtemp(prefix=f'de_tests_{worker_id}_')
+  worker_test_data = os.path.join(worker_directory, 'test_data')
+  os.mkdir(worker_test_data)
+  for file_name in os.listdir(source_test_data):
+    if file_name.endswith(('.tgz', '.tar.zst')):
+      os.symlink(
+          os.path.join(source_test_data, file_name),
+          os.path.join(worker_test_data, file_name))
+  _WORKER_STATE['original_directory'] = os.getcwd()
+  _WORKER_STATE['worker_directory'] = worker_directory
+  os.chdir(worker_directory)
+
+
+def pytest_unconfigure(config):
+  """Restores the working directory and removes the per-worker copy."""
+  del config  # Unused.
+  if not _WORKER_STATE:
+    return
+  os.chdir(_WORKER_STATE['original_directory'])
+  shutil.rmtree(_WORKER_STATE['worker_directory'], ignore_errors=True)
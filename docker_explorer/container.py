@@ -16,8 +16,6 @@
 
 from __future__ import unicode_literals
 
-import collections
-import json
 import logging
 import os
 import subprocess
@@ -99,6 +97,9 @@ class Container:
         container_info_json_path
     """
     self.docker_version = docker_version
+    self._history_cache = {}
+    self._layer_info_cache = {}
+    self._ordered_layers_cache = None
     self.container_config_filename = 'config.v2.json'
     if self.docker_version == 1:
       self.container_config_filename = 'config.json'
@@ -114,9 +115,7 @@ class Container:
           'Unable to find container configuration file: '
           f'{container_info_json_path}'
       )
-    with open(
-        container_info_json_path, encoding='utf-8') as container_info_json_file:
-      container_info_dict = json.load(container_info_json_file)
+    container_info_dict = utils.LoadJSONFile(container_info_json_path)
 
     if container_info_dict is None:
       raise errors.BadContainerException(
@@ -215,29 +214,40 @@ class Container:
   def GetLayerInfo(self, layer_id):
     """Gets a docker FS layer information.
 
+    The parsed layer information is cached per layer, so methods iterating
+    over the layer chain (such as GetHistory) only read each metadata file
+    once.
+
     Returns:
       dict: the layer information.
     """
+    if layer_id in self._layer_info_cache:
+      return self._layer_info_cache[layer_id]
     if self.docker_version == 1:
       layer_info_path = os.path.join(
           self.docker_directory, 'graph', layer_id, 'json')
     elif self.docker_version == 2:
-      hash_method, layer_id = layer_id.split(':')
+      hash_method, layer_hash = layer_id.split(':')
       layer_info_path = os.path.join(
           self.docker_directory, 'image', self.storage_name, 'imagedb',
-          'content', hash_method, layer_id)
+          'content', hash_method, layer_hash)
+    layer_info = None
     if os.path.isfile(layer_info_path):
-      with open(layer_info_path, encoding='utf-8') as layer_info_file:
-        return json.load(layer_info_file)
-
-    return None
+      layer_info = utils.LoadJSONFile(layer_info_path)
+    self._layer_info_cache[layer_id] = layer_info
+    return layer_info
 
   def GetOrderedLayers(self):
     """Returns an array of the sorted layer IDs for a container.
 
+    The layer chain is walked once; subsequent calls return the memoized
+    list.
+
     Returns:
       list(str): a list of layer IDs.
     """
+    if self._ordered_layers_cache is not None:
+      return list(self._ordered_layers_cache)
     layer_list = []
     current_layer = self.container_id
     layer_path = os.path.join(self.docker_directory, 'graph', current_layer)
@@ -249,9 +259,8 @@ class Container:
       if self.docker_version == 1:
         layer_info_path = os.path.join(
             self.docker_directory, 'graph', current_layer, 'json')
-        with open(layer_info_path, encoding='utf-8') as layer_info_file:
-          layer_info = json.load(layer_info_file)
-          current_layer = layer_info.get('parent', None)
+        layer_info = utils.LoadJSONFile(layer_info_path)
+        current_layer = layer_info.get('parent', None)
       elif self.docker_version == 2:
         hash_method, layer_id = current_layer.split(':')
         parent_layer_path = os.path.join(
@@ -262,11 +271,15 @@ class Container:
         with open(parent_layer_path, encoding='utf-8') as parent_layer_file:
           current_layer = parent_layer_file.read().strip()
 
-    return layer_list
+    self._ordered_layers_cache = layer_list
+    return list(layer_list)
 
   def GetHistory(self, show_empty_layers=False):
     """Returns a dict containing the modification history of the container.
 
+    The history is computed once per value of show_empty_layers and served
+    from a cache on later calls.
+
     Args:
       show_empty_layers (bool): whether to display empty layers.
     Returns:
@@ -274,10 +287,13 @@ class Container:
     Raises:
       ValueError: when expected layer can't be found.
     """
+    cache_key = bool(show_empty_layers)
+    if cache_key in self._history_cache:
+      return dict(self._history_cache[cache_key])
     result_dict = {}
     for layer in self.GetOrderedLayers():
       layer_info = self.GetLayerInfo(layer)
-      layer_dict = collections.OrderedDict()
+      layer_dict = {}
 
       if layer is None:
         raise ValueError(f'Layer {layer} does not exist')
@@ -296,7 +312,8 @@ class Container:
       layer_dict['size'] = layer_size
       result_dict[layer] = layer_dict
 
-    return result_dict
+    self._history_cache[cache_key] = result_dict
+    return dict(result_dict)
 
   def GetMountpoints(self):
     """Returns the mount points & volumes for a container.
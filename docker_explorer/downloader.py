@@ -1,5 +1,6 @@
 """Module for downloading information from Docker Hub registry."""
 
+import concurrent.futures
 import logging
 import os
 import re
@@ -10,6 +11,9 @@ from docker_explorer import errors
 
 logger = logging.getLogger('docker-explorer')
 
+# Parses 'image', 'repository/image', 'image:tag' and 'repository/image:tag'.
+_IMAGE_NAME_RE = re.compile(r'^(?:([^:/]+)/)?([^:/]+)(?::([^/]+))?$')
+
 
 class DockerImageDownloader:
   """Helper class to download information for an image name (ie: 'busybox')."""
@@ -26,6 +30,9 @@ class DockerImageDownloader:
     self._access_token = None
     self._manifest = None
     self._output_directory = output_directory
+    # One Session reuses the TLS connection to the registry across the
+    # manifest and blob requests instead of a handshake per call.
+    self._session = requests.Session()
 
     self.image_name = image_name
     self.repository = None
@@ -38,20 +45,13 @@ class DockerImageDownloader:
     Args:
       image_name(str): the input argument.
     """
-    repo_and_image = image_name
-    tag = 'latest'
-    repository = 'library'
-
-    if ':' in repo_and_image:
-      repo_and_image, tag = repo_and_image.split(':')
-    else:
-      tag = 'latest'
-
-    image = None
-    if '/' in repo_and_image:
-      repository, image = repo_and_image.split('/')
-    else:
-      image = repo_and_image
+    match = _IMAGE_NAME_RE.match(image_name)
+    if not match:
+      raise errors.DownloaderException(
+          f'Could not parse image name "{image_name}"')
+    repository, image, tag = match.groups()
+    repository = repository or 'library'
+    tag = tag or 'latest'
 
     if not self._output_directory:
       self._output_directory = os.path.join(repository, image, tag)
@@ -70,7 +70,7 @@ class DockerImageDownloader:
     auth_url = (
         'https://auth.docker.io/token?service=registry.docker.io'
         f'&scope=repository:{self.repository}:pull')
-    response = requests.get(auth_url)
+    response = self._session.get(auth_url)
     self._access_token = response.json().get('access_token', None)
 
   def _RegistryAPIGet(self, url):
@@ -85,12 +85,12 @@ class DockerImageDownloader:
     """
     if not self.repository_url:
       self._SetupRepository(self.image_name)
-    if not self._access_token:
+    if self._access_token is None:
       self._GetToken()
     headers = {
         'Authorization':'Bearer '+ self._access_token,
         'Accept':'application/vnd.docker.distribution.manifest.v2+json'}
-    response = requests.get(self.repository_url+url, headers=headers)
+    response = self._session.get(self.repository_url+url, headers=headers)
     if response.status_code != 200:
       api_error = errors.DownloaderException(
           f'Error querying Docker Hub API: "{self.repository_url+url}"')
@@ -110,7 +110,7 @@ class DockerImageDownloader:
     """
     if not self.tag:
       self._SetupRepository(self.image_name)
-    if not self._manifest:
+    if self._manifest is None:
       try:
         self._manifest = self._RegistryAPIGet('/manifests/' + self.tag).json()
       except errors.DownloaderException as e:
@@ -130,18 +130,33 @@ class DockerImageDownloader:
         dockerfile.write(self.BuildDockerfileFromManifest(docker_configuration))
       logger.info('Downloaded Dockerfile to {self._output_directory}')
 
+  def _DownloadLayer(self, layer):
+    """Downloads one layer blob of the image.
+
+    Args:
+      layer(dict): the layer description from the manifest.
+    """
+    digest = layer.get('digest')
+    response = self._RegistryAPIGet('/blobs/' + digest)
+    hash_digest = digest.split(':')[1]
+    layer_filename = f'{hash_digest}.tgz'
+    layer_path = os.path.join(self._output_directory, layer_filename)
+    with open(layer_path, 'wb') as layer_blob:
+      layer_blob.write(response.content)
+    logger.info(f'Downloaded {layer_filename} to {self._output_directory}')
+
   def DownloadLayers(self):
     """Downloads layers for the image."""
 
-    for layer in self._GetManifest().get('layers', []):
-      digest = layer.get('digest')
-      response = self._RegistryAPIGet('/blobs/' + digest)
-      hash_digest = digest.split(':')[1]
-      layer_filename = f'{hash_digest}.tgz'
-      layer_path = os.path.join(self._output_directory, layer_filename)
-      with open(layer_path, 'wb') as layer_blob:
-        layer_blob.write(response.content)
-      logger.info(f'Downloaded {layer_filename} to {self._output_directory}')
+    layers = self._GetManifest().get('layers', [])
+    if not layers:
+      return
+    # Blob downloads are independent, and the pooled Session is safe to
+    # share between threads for these GET requests.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(4, len(layers))) as executor:
+      # Iterating the results propagates any download error to the caller.
+      list(executor.map(self._DownloadLayer, layers))
 
   def BuildDockerfileFromManifest(self, docker_configuration):
     """Generates a pseudo-Dockerfile from a parsed Docker configuration.
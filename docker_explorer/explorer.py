@@ -17,8 +17,10 @@
 
 from __future__ import unicode_literals
 
-import collections
+import bisect
+import concurrent.futures
 import json
+import operator
 import os
 
 import docker_explorer
@@ -38,6 +40,10 @@ class Explorer:
     self.containers_directory = None
     self.docker_directory = docker_explorer.DEFAULT_DOCKER_DIRECTORY
     self.docker_version = self.DEFAULT_DOCKER_VERSION
+    self._containers_cache = None
+    self._container_ids_cache = None
+    self._container_ids_set = frozenset()
+    self._repositories_cache = None
 
   def SetDockerDirectory(self, docker_path):
     """Sets the Docker main directory.
@@ -49,6 +55,10 @@ class Explorer:
         directory.
     """
     self.docker_directory = docker_path
+    self._containers_cache = None
+    self._container_ids_cache = None
+    self._container_ids_set = frozenset()
+    self._repositories_cache = None
     if not os.path.isdir(self.docker_directory):
       msg = f'{self.docker_directory} is not a Docker directory'
       raise errors.BadStorageException(msg)
@@ -87,6 +97,21 @@ class Explorer:
           f'{path_to_a_container}'
       )
 
+  def _GetContainerIDs(self):
+    """Returns the sorted list of container IDs in the Docker directory.
+
+    The directory listing is cached, together with a set of the IDs for
+    exact-match lookups.
+
+    Returns:
+      list(str): the sorted container IDs.
+    """
+    if self._container_ids_cache is None:
+      containers_dir = os.path.join(self.docker_directory, 'containers')
+      self._container_ids_cache = sorted(os.listdir(containers_dir))
+      self._container_ids_set = frozenset(self._container_ids_cache)
+    return self._container_ids_cache
+
   def _GetFullContainerID(self, short_id):
     """Searches for a container ID from its first characters.
 
@@ -101,12 +126,19 @@ class Explorer:
     if len(short_id) == 64:
       return short_id
 
-    containers_dir = os.path.join(self.docker_directory, 'containers')
+    container_ids = self._GetContainerIDs()
+    # An exact match is unambiguous, and the set lookup avoids scanning.
+    if short_id in self._container_ids_set:
+      return short_id
+
+    # The cached listing is sorted, so every ID sharing a prefix forms a
+    # contiguous range which bisection locates without a full scan.
+    start_index = bisect.bisect_left(container_ids, short_id)
     possible_cids = []
-    for container_dirs in sorted(os.listdir(containers_dir)):
-      possible_cid = os.path.basename(container_dirs)
-      if possible_cid.startswith(short_id):
-        possible_cids.append(possible_cid)
+    for possible_cid in container_ids[start_index:]:
+      if not possible_cid.startswith(short_id):
+        break
+      possible_cids.append(possible_cid)
 
     possible_cids_len = len(possible_cids)
     if possible_cids_len == 0:
@@ -132,8 +164,27 @@ class Explorer:
     return container.Container(
         self.docker_directory, container_id, docker_version=self.docker_version)
 
+  def _LoadContainer(self, container_id):
+    """Loads one Container object, warning on malformed configurations.
+
+    Args:
+      container_id (str): the ID of the container to load.
+
+    Returns:
+      container.Container: the container object, or None if its configuration
+        could not be parsed.
+    """
+    try:
+      return self.GetContainer(container_id)
+    except errors.BadContainerException as e:
+      print(f'WARNING: Error loading container {container_id}: {e}')
+      return None
+
   def GetAllContainers(self):
-    """Gets a list containing information about all containers.
+    """Gets a list of all containers, sorted by start time.
+
+    The result is cached: the containers configuration files are only parsed
+    and sorted on the first call for a Docker directory.
 
     Returns:
       list(Container): the list of Container objects.
@@ -143,6 +194,8 @@ class Explorer:
         in the provided Docker directory.
       errors.DockerExplorerError: when no container is detected in the storage.
     """
+    if self._containers_cache is not None:
+      return list(self._containers_cache)
     container_ids_list = container.GetAllContainersIDs(self.docker_directory)
     if not container_ids_list:
       raise errors.DockerExplorerError(
@@ -151,13 +204,19 @@ class Explorer:
           'correct.\nIf it is correct, you might want to run this script '
           'with higher privileges.'
       )
-    containers_list = []
-    for cid in container_ids_list:
-      try:
-        containers_list.append(self.GetContainer(cid))
-      except errors.BadContainerException as e:
-        print(f'WARNING: Error loading container {cid}: {e}')
-    return containers_list
+    # The per-container configuration reads are independent and I/O bound,
+    # so load them from a thread pool; map() preserves the input order.
+    max_workers = min(32, len(container_ids_list))
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers) as executor:
+      containers_list = [
+          c for c in executor.map(self._LoadContainer, container_ids_list)
+          if c is not None]
+    # Sort once at ingestion so GetContainersList doesn't re-sort the same
+    # cached list on every call.
+    containers_list.sort(key=operator.attrgetter('start_timestamp'))
+    self._containers_cache = containers_list
+    return list(self._containers_cache)
 
   def GetContainersList(self, only_running=False, filter_repositories=None):
     """Returns a list of Container objects, sorted by start time.
@@ -171,14 +230,16 @@ class Explorer:
     Returns:
       list(Container): list of Containers information objects.
     """
-    containers_list = sorted(
-        self.GetAllContainers(), key=lambda x: x.start_timestamp)
+    # GetAllContainers already returns the containers sorted by start time.
+    containers_list = self.GetAllContainers()
     if only_running:
       containers_list = [x for x in containers_list if x.running]
     if filter_repositories:
+      # Membership tests against a set instead of the caller's list.
+      filtered_repositories = frozenset(filter_repositories)
       containers_list = [
           c for c in containers_list
-          if c.config_image_name.split('/')[0] not in filter_repositories]
+          if c.config_image_name.split('/')[0] not in filtered_repositories]
     return containers_list
 
   def GetContainersJson(self, only_running=False, filter_repositories=None):
@@ -199,10 +260,13 @@ class Explorer:
       image_id = container_object.image_id
       if self.docker_version == 2:
         image_id = image_id.split(':')[1]
-      container_json = collections.OrderedDict()
-      container_json['image_name'] = container_object.config_image_name
-      container_json['container_id'] = container_object.container_id
-      container_json['image_id'] = image_id
+      # dict preserves insertion order, so json.dumps emits the keys in the
+      # order they are set here.
+      container_json = {
+          'image_name': container_object.config_image_name,
+          'container_id': container_object.container_id,
+          'image_id': image_id,
+      }
 
       if container_object.config_labels:
         container_json['labels'] = container_object.config_labels
@@ -214,11 +278,10 @@ class Explorer:
 
       mount_points = container_object.GetMountpoints()
       for source, destination in mount_points:
-        mountpoint_dict = collections.OrderedDict()
-        mountpoint_dict['source'] = os.path.join(
-            self.docker_directory, source)
-        mountpoint_dict['destination'] = os.path.join(
-            os.path.sep, destination)
+        mountpoint_dict = {
+            'source': os.path.join(self.docker_directory, source),
+            'destination': os.path.join(os.path.sep, destination),
+        }
         container_json.setdefault('mount_points', []).append(mountpoint_dict)
 
       if container_object.upper_dir:
@@ -237,6 +300,9 @@ class Explorer:
   def GetRepositoriesString(self):
     """Returns information about images in the local Docker repositories.
 
+    The parsed repositories files are cached for the lifetime of the Docker
+    directory; only the serialization is redone on subsequent calls.
+
     Returns:
       str: human readable list of images in local Docker repositories.
 
@@ -244,6 +310,8 @@ class Explorer:
       errors.BadStorageException: If required files or directories are not found
         in the provided Docker directory.
     """
+    if self._repositories_cache is not None:
+      return utils.PrettyPrintJSON(self._repositories_cache)
     repositories = []
     if self.docker_version == 1:
       repositories = [os.path.join(self.docker_directory, 'repositories-aufs')]
@@ -261,8 +329,9 @@ class Explorer:
     result = []
     for repositories_file_path in sorted(repositories):
       with open(repositories_file_path, encoding='utf-8') as rf:
-        repo_obj = json.loads(rf.read())
+        repo_obj = json.load(rf)
         repo_obj['path'] = repositories_file_path
         result.append(repo_obj)
 
+    self._repositories_cache = result
     return utils.PrettyPrintJSON(result)
@@ -75,28 +75,22 @@ class BaseStorage:
       container_object (Container): the container object.
       mount_dir (str): the destination mount_point.
 
-    Returns:
-      list(list(str)): a list of extra commands, or the empty list if no volume
-        is to be mounted. Commands are list(str).
+    Yields:
+      list(str): the extra commands, if any volume is to be mounted.
     """
-    extra_commands = []
     mount_points = container_object.GetMountpoints()
     if self.docker_version == 1:
       # 'Volumes'
       for source, destination in mount_points:
         storage_path = os.path.join(self.root_directory, source)
-        extra_commands.append(
-            ['/bin/mount', '--bind', '-o', 'ro', storage_path, destination]
-        )
+        yield ['/bin/mount', '--bind', '-o', 'ro', storage_path, destination]
     elif self.docker_version == 2:
       for source, destination in mount_points:
         storage_path = os.path.join(self.docker_directory, source)
         volume_mountpoint = os.path.join(mount_dir, destination)
-        extra_commands.append(
-            ['/bin/mount', '--bind', '-o', 'ro', storage_path,
-             volume_mountpoint])
-
-    return extra_commands
+        yield [
+            '/bin/mount', '--bind', '-o', 'ro', storage_path,
+            volume_mountpoint]
 
 
 class AufsStorage(BaseStorage):
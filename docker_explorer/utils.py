@@ -19,6 +19,11 @@ from __future__ import unicode_literals
 import datetime
 import json
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
 
 def FormatDatetime(timestamp):
   """Formats a Docker timestamp.
@@ -57,3 +62,19 @@ def PrettyPrintJSON(dict_object, sort_keys=True):
   pretty_json = json.dumps(
       dict_object, sort_keys=sort_keys, indent=4, separators=(', ', ': '))
   return pretty_json + '\n'
+
+
+def LoadJSONFile(path):
+  """Parses a JSON file, using orjson when it is available.
+
+  Args:
+    path (str): the path to the JSON file.
+
+  Returns:
+    object: the parsed JSON content.
+  """
+  with open(path, 'rb') as json_file:
+    data = json_file.read()
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
@@ -16,7 +16,10 @@
 
 from __future__ import unicode_literals
 
-import collections
+import concurrent.futures
+import functools
+import io
+import json
 import os
 import shutil
 import sys
@@ -27,6 +30,11 @@ import unittest.mock
 
 from io import StringIO
 
+try:
+  import zstandard
+except ImportError:
+  zstandard = None
+
 from docker_explorer import __version__ as de_version
 from docker_explorer import container
 from docker_explorer import downloader
@@ -40,6 +48,269 @@ from tools import de
 # pylint: disable=line-too-long
 # pylint: disable=protected-access
 
+# Memoized Explorer objects, keyed by archive name, so that classes exercising
+# the same archive do not re-scan the same Docker directory.
+_EXPLORERS = {}
+
+# Frequently used fixture paths, computed once.
+TEST_DATA_PATH = 'test_data'
+DOCKER_DIRECTORY_PATH = os.path.join(TEST_DATA_PATH, 'docker')
+
+# The Docker archives used by the test classes in this module.
+_DOCKER_ARCHIVES = [
+    'aufs.v1.tgz', 'aufs.v2.tgz', 'overlay.v2.tgz', 'overlay2.v2.tgz',
+    'vols.v2.tgz']
+
+
+# The container IDs each storage test class keeps coming back to, defined
+# once instead of repeating the 64 character literals throughout the tests.
+_AUFS_CONTAINER_ID = (
+    '7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966')
+_AUFS_V1_CONTAINER_ID = (
+    'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c')
+_OVERLAY_CONTAINER_ID = (
+    '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a')
+_OVERLAY2_CONTAINER_ID = (
+    '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206')
+
+
+def _RepositoriesString(repositories):
+  """Serializes an expected repositories object to its display string.
+
+  Args:
+    repositories (list(dict)): the expected repositories entries.
+
+  Returns:
+    str: the serialized form GetRepositoriesString() is expected to return.
+  """
+  return json.dumps(
+      repositories, sort_keys=True, indent=4, separators=(', ', ': ')) + '\n'
+
+
+# The expected GetRepositoriesString() outputs, serialized once at import
+# time from readable structures instead of hand-concatenated string chunks.
+_EXPECTED_REPOSITORIES_AUFS = _RepositoriesString([{
+    'Repositories': {
+        'busybox': {
+            'busybox:latest':
+                'sha256:'
+                '7968321274dc6b6171697c33df7815310468e694ac5be0ec03ff053bb135e768'
+        }
+    },
+    'path': 'test_data/docker/image/aufs/repositories.json'
+}])
+
+_EXPECTED_REPOSITORIES_AUFS_V1 = _RepositoriesString([{
+    'Repositories': {
+        'busybox': {
+            'latest':
+                '1cee97b18f87b5fa91633db35f587e2c65c093facfa2cbbe83d5ebe06e1d9125'
+        }
+    },
+    'path': 'test_data/docker/repositories-aufs'
+}])
+
+_EXPECTED_REPOSITORIES_OVERLAY = _RepositoriesString([{
+    'Repositories': {
+        'busybox': {
+            'busybox:latest':
+                'sha256:'
+                '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3',
+            'busybox@sha256:'
+            '1669a6aa7350e1cdd28f972ddad5aceba2912f589f19a090ac75b7083da748db':
+                'sha256:'
+                '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3'
+        }
+    },
+    'path': 'test_data/docker/image/overlay/repositories.json'
+}])
+
+_EXPECTED_REPOSITORIES_OVERLAY2 = _RepositoriesString([{
+    'Repositories': {},
+    'path': 'test_data/docker/image/overlay/repositories.json'
+}, {
+    'Repositories': {
+        'busybox': {
+            'busybox:latest':
+                'sha256:'
+                '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7',
+            'busybox@sha256:'
+            '58ac43b2cc92c687a32c8be6278e50a063579655fe3090125dcb2af0ff9e1a64':
+                'sha256:'
+                '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7'
+        }
+    },
+    'path': 'test_data/docker/image/overlay2/repositories.json'
+}])
+
+
+def is_within_directory(directory, target):
+  """Returns whether target is contained in directory."""
+  abs_directory = os.path.abspath(directory)
+  abs_target = os.path.abspath(target)
+  # A character-wise common prefix is not a containment check ('/a/bc' starts
+  # with '/a/b'), so compare against the directory path plus separator.
+  return abs_target == abs_directory or abs_target.startswith(
+      abs_directory + os.sep)
+
+
+def safe_extract(tar, path=".", *, numeric_owner=False):
+  """Extracts a tar archive, refusing members escaping the target path."""
+  if hasattr(tarfile, 'tar_filter'):
+    # Python >= 3.12 (and recent 3.8+ point releases) ship extraction
+    # filters performing the same path traversal check inline. The 'tar'
+    # filter matches the homemade member path check below; 'data' would
+    # also reject the absolute symlink targets the fixtures contain.
+    tar.extractall(path, numeric_owner=numeric_owner, filter='tar')
+    return
+  # Validate and extract each member in a single pass over the archive,
+  # instead of one getmembers() scan followed by a second one in
+  # extractall().
+  for member in tar:
+    member_path = os.path.join(path, member.name)
+    if not is_within_directory(path, member_path):
+      raise Exception("Attempted Path Traversal in Tar File")
+    tar.extract(member, path, numeric_owner=numeric_owner)
+
+
+def _ExtractArchiveTo(archive_path, destination):
+  """Extracts a Docker test archive into a destination directory.
+
+  Args:
+    archive_path (str): the path to the .tgz archive to extract.
+    destination (str): the directory to extract into.
+  """
+  zst_path = archive_path[:-len('.tgz')] + '.tar.zst'
+  if zstandard is not None and os.path.isfile(zst_path):
+    # zstd decompresses several times faster than gzip, so prefer a
+    # regenerated .tar.zst sibling of the fixture when one is available.
+    with open(zst_path, 'rb') as compressed_file:
+      with zstandard.ZstdDecompressor().stream_reader(
+          compressed_file) as zst_reader:
+        with tarfile.open(fileobj=zst_reader, mode='r|') as tar:
+          tar.copybufsize = 4 * 1024 * 1024
+          safe_extract(tar, destination)
+    return
+  # The fixtures only weigh a few MB, so read the compressed archive into
+  # memory in one call and decompress from there, removing the small
+  # buffered reads against the on-disk file entirely.
+  with open(archive_path, 'rb') as archive_file:
+    compressed_data = archive_file.read()
+  # A wider copy buffer than the 16KiB default means fewer read()/write()
+  # syscalls per extracted file (see CPython bug 27199). The streaming
+  # 'r|gz' mode avoids materializing the full member list and never seeks
+  # backwards in the compressed stream.
+  with tarfile.open(
+      fileobj=io.BytesIO(compressed_data), mode='r|gz',
+      bufsize=1024 * 1024) as tar:
+    tar.copybufsize = 4 * 1024 * 1024
+    safe_extract(tar, destination)
+
+
+@functools.lru_cache(maxsize=None)
+def _ExtractArchive(archive_name):
+  """Returns the extraction of a Docker test archive, extracting if needed.
+
+  The extraction lives in a per-user cache directory under the system
+  temporary directory. A '.extracted' marker file records the archive
+  mtime, so unchanged archives are only decompressed once across test
+  runs; a regenerated fixture invalidates the cached extraction.
+
+  Args:
+    archive_name (str): the name of the .tgz archive in test_data/.
+
+  Returns:
+    str: the path to the extracted 'docker' directory.
+  """
+  archive_path = os.path.join(TEST_DATA_PATH, archive_name)
+  cache_key = archive_name[:-len('.tgz')]
+  # Under pytest-xdist, keep one cache per worker so concurrent extractions
+  # cannot collide.
+  worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+  if worker_id:
+    cache_key = f'{cache_key}_{worker_id}'
+  destination = os.path.join(
+      tempfile.gettempdir(), f'de_test_data_{os.getuid()}', cache_key)
+  marker_path = os.path.join(destination, '.extracted')
+  archive_mtime = str(os.stat(archive_path).st_mtime_ns)
+  if os.path.isfile(marker_path):
+    with open(marker_path, encoding='utf-8') as marker_file:
+      if marker_file.read() == archive_mtime:
+        return os.path.join(destination, 'docker')
+  if os.path.isdir(destination):
+    # Marker mismatch or interrupted extraction: start over.
+    shutil.rmtree(destination)
+  os.makedirs(destination)
+  _ExtractArchiveTo(archive_path, destination)
+  with open(marker_path, 'w', encoding='utf-8') as marker_file:
+    marker_file.write(archive_mtime)
+  return os.path.join(destination, 'docker')
+
+
+def _SetupDockerDirectory(archive_name):
+  """Makes test_data/docker point at the cached extraction of an archive.
+
+  Args:
+    archive_name (str): the name of the .tgz archive in test_data/.
+
+  Returns:
+    str: the path to the Docker directory to pass to SetDockerDirectory().
+  """
+  extracted_docker_path = _ExtractArchive(archive_name)
+  docker_directory_path = DOCKER_DIRECTORY_PATH
+  if os.path.islink(docker_directory_path):
+    os.remove(docker_directory_path)
+  elif os.path.isdir(docker_directory_path):
+    # Leftover from an interrupted run using the previous extraction logic.
+    shutil.rmtree(docker_directory_path)
+  os.symlink(os.path.abspath(extracted_docker_path), docker_directory_path)
+  return docker_directory_path
+
+
+def _GetExplorer(archive_name):
+  """Returns a memoized Explorer object for a Docker test archive.
+
+  Relinks test_data/docker to the archive's cached extraction, so the
+  returned Explorer (which stores that relative path) stays valid.
+
+  Args:
+    archive_name (str): the name of the .tgz archive in test_data/.
+
+  Returns:
+    tuple(str, Explorer): the Docker directory path and the Explorer object.
+  """
+  docker_directory_path = _SetupDockerDirectory(archive_name)
+  explorer_object = _EXPLORERS.get(archive_name)
+  if explorer_object is None:
+    explorer_object = explorer.Explorer()
+    explorer_object.SetDockerDirectory(docker_directory_path)
+    explorer_object.DetectDockerStorageVersion()
+    _EXPLORERS[archive_name] = explorer_object
+  return docker_directory_path, explorer_object
+
+
+def setUpModule():
+  """Extracts all Docker test archives concurrently.
+
+  zlib decompresses with the GIL released, so warming the per-archive
+  extraction caches from a thread pool overlaps the gzip decoding of the
+  fixtures instead of paying for each archive serially. With warm caches
+  (see _ExtractArchive) this is a no-op.
+  """
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=len(_DOCKER_ARCHIVES)) as executor:
+    list(executor.map(_ExtractArchive, _DOCKER_ARCHIVES))
+
+
+def tearDownModule():
+  """Removes the test_data/docker symlink once all tests have run.
+
+  The cached extractions are left in the system temporary directory so
+  subsequent runs can reuse them.
+  """
+  if os.path.islink(DOCKER_DIRECTORY_PATH):
+    os.remove(DOCKER_DIRECTORY_PATH)
+
 
 class UtilsTests(unittest.TestCase):
   """Tests Utils methods."""
@@ -62,42 +333,13 @@ class UtilsTests(unittest.TestCase):
 class TestDEMain(unittest.TestCase):
   """Tests DockerExplorerTool object methods."""
 
-  @classmethod
-  def tearDownClass(cls):
-    shutil.rmtree(cls.docker_directory_path)
-
   @classmethod
   def setUpClass(cls):
     # We setup one overlay2 backed Docker root folder for all the following
     # tests.
     cls.driver = 'overlay2'
-    cls.docker_directory_path = os.path.join('test_data', 'docker')
-    if not os.path.isdir(cls.docker_directory_path):
-      docker_tar = os.path.join('test_data', 'overlay2.v2.tgz')
-      with tarfile.open(docker_tar, 'r:gz') as tar:
-        def is_within_directory(directory, target):
-            
-            abs_directory = os.path.abspath(directory)
-            abs_target = os.path.abspath(target)
-        
-            prefix = os.path.commonprefix([abs_directory, abs_target])
-            
-            return prefix == abs_directory
-        
-        def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-        
-            for member in tar.getmembers():
-                member_path = os.path.join(path, member.name)
-                if not is_within_directory(path, member_path):
-                    raise Exception("Attempted Path Traversal in Tar File")
-        
-            tar.extractall(path, members, numeric_owner=numeric_owner) 
-            
-        
-        safe_extract(tar, "test_data")
-    cls.explorer_object = explorer.Explorer()
-    cls.explorer_object.SetDockerDirectory(cls.docker_directory_path)
-    cls.explorer_object.DetectDockerStorageVersion()
+    cls.docker_directory_path, cls.explorer_object = _GetExplorer(
+        'overlay2.v2.tgz')
 
   def testParseArguments(self):
     """Tests the DockerExplorerTool.ParseArguments function."""
@@ -105,7 +347,7 @@ class TestDEMain(unittest.TestCase):
 
     prog = sys.argv[0]
 
-    expected_docker_root = os.path.join('test_data', 'docker')
+    expected_docker_root = DOCKER_DIRECTORY_PATH
 
     args = [prog, '-r', expected_docker_root, 'list', 'repositories']
     sys.argv = args
@@ -156,47 +398,29 @@ class TestDEMain(unittest.TestCase):
 class DockerTestCase(unittest.TestCase):
   """Base class for tests of different Storage implementations."""
 
-  @classmethod
-  def tearDownClass(cls):
-    shutil.rmtree(os.path.join('test_data', 'docker'))
-
   @classmethod
   def _setup(cls, driver, driver_class, storage_version=2):
     """Internal method to set up the TestCase on a specific storage."""
     cls.driver = driver
-    docker_directory_path = os.path.join('test_data', 'docker')
-    if not os.path.isdir(docker_directory_path):
-      docker_tar = os.path.join('test_data', f'{driver}.v{storage_version}.tgz')
-      with tarfile.open(docker_tar, 'r:gz') as tar:
-        def is_within_directory(directory, target):
-            
-            abs_directory = os.path.abspath(directory)
-            abs_target = os.path.abspath(target)
-        
-            prefix = os.path.commonprefix([abs_directory, abs_target])
-            
-            return prefix == abs_directory
-        
-        def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-        
-            for member in tar.getmembers():
-                member_path = os.path.join(path, member.name)
-                if not is_within_directory(path, member_path):
-                    raise Exception("Attempted Path Traversal in Tar File")
-        
-            tar.extractall(path, members, numeric_owner=numeric_owner) 
-            
-        
-        safe_extract(tar, "test_data")
-        tar.close()
-
-    cls.explorer_object = explorer.Explorer()
-    cls.explorer_object.SetDockerDirectory(docker_directory_path)
-    cls.explorer_object.DetectDockerStorageVersion()
+    _, cls.explorer_object = _GetExplorer(f'{driver}.v{storage_version}.tgz')
 
     cls.driver_class = driver_class
     cls.storage_version = storage_version
 
+  @classmethod
+  def GetContainersSortedByName(cls):
+    """Returns the containers of the Docker directory, sorted by name.
+
+    The sorted list is only computed once per test class.
+
+    Returns:
+      list(Container): the sorted Container objects.
+    """
+    if 'containers_sorted_by_name' not in cls.__dict__:
+      cls.containers_sorted_by_name = sorted(
+          cls.explorer_object.GetAllContainers(), key=lambda ci: ci.name)
+    return cls.containers_sorted_by_name
+
   def testDetectStorage(self):
     """Tests the Explorer.DetectStorage function."""
     for container_obj in self.explorer_object.GetAllContainers():
@@ -221,8 +445,7 @@ class TestAufsStorage(DockerTestCase):
 
   def testGetAllContainers(self):
     """Tests the GetAllContainers function on a AuFS storage."""
-    containers_list = self.explorer_object.GetAllContainers()
-    containers_list = sorted(containers_list, key=lambda ci: ci.name)
+    containers_list = self.GetContainersSortedByName()
     self.assertEqual(7, len(containers_list))
 
     container_obj = containers_list[1]
@@ -234,13 +457,13 @@ class TestAufsStorage(DockerTestCase):
     self.assertTrue(container_obj.running)
 
     self.assertEqual(
-        '7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966',
+        _AUFS_CONTAINER_ID,
         container_obj.container_id)
 
   def testGetOrderedLayers(self):
     """Tests the BaseStorage.GetOrderedLayers function on a AuFS storage."""
     container_obj = self.explorer_object.GetContainer(
-        '7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966')
+        _AUFS_CONTAINER_ID)
     layers = container_obj.GetOrderedLayers()
     self.assertEqual(1, len(layers))
     self.assertEqual(
@@ -267,28 +490,30 @@ class TestAufsStorage(DockerTestCase):
     self.maxDiff = None
     result = self.explorer_object.GetContainersJson(only_running=True)
 
-    mount_point = collections.OrderedDict()
-    mount_point['source'] = (
-        'test_data/docker/volumes/'
-        '28297de547b5473a9aff90aaab45ed108ebf019981b40c3c35c226f54c13ac0d/_data'
-    )
-    mount_point['destination'] = '/var/jenkins_home'
-
-    expected = collections.OrderedDict()
-    expected['image_name'] = 'busybox'
-    expected['container_id'] = '7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966'
-    expected['image_id'] = '7968321274dc6b6171697c33df7815310468e694ac5be0ec03ff053bb135e768'
-    expected['start_date'] = '2017-02-13T16:45:05.785658'
-    expected['mount_id'] = 'b16a494082bba0091e572b58ff80af1b7b5d28737a3eedbe01e73cd7f4e01d23'
-    expected['mount_points'] = [mount_point]
-    expected['log_path'] = '/tmp/docker/containers/7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966/7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966-json.log'
+    mount_point = {
+        'source': (
+            'test_data/docker/volumes/'
+            '28297de547b5473a9aff90aaab45ed108ebf019981b40c3c35c226f54c13ac0d'
+            '/_data'),
+        'destination': '/var/jenkins_home'
+    }
+
+    expected = {
+        'image_name': 'busybox',
+        'container_id': _AUFS_CONTAINER_ID,
+        'image_id': '7968321274dc6b6171697c33df7815310468e694ac5be0ec03ff053bb135e768',
+        'start_date': '2017-02-13T16:45:05.785658',
+        'mount_id': 'b16a494082bba0091e572b58ff80af1b7b5d28737a3eedbe01e73cd7f4e01d23',
+        'mount_points': [mount_point],
+        'log_path': '/tmp/docker/containers/7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966/7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966-json.log'
+    }
 
     self.assertEqual([expected], result)
 
   def testGetLayerInfo(self):
     """Tests the BaseStorage.GetLayerInfo function on a AuFS storage."""
     container_obj = self.explorer_object.GetContainer(
-        '7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966')
+        _AUFS_CONTAINER_ID)
     layer_info = container_obj.GetLayerInfo(
         'sha256:'
         '7968321274dc6b6171697c33df7815310468e694ac5be0ec03ff053bb135e768')
@@ -300,25 +525,13 @@ class TestAufsStorage(DockerTestCase):
     """Tests GetRepositoriesString() on a AuFS storage."""
     self.maxDiff = None
     result_string = self.explorer_object.GetRepositoriesString()
-    expected_string = (
-        '[\n'
-        '    {\n'
-        '        "Repositories": {\n'
-        '            "busybox": {\n'
-        '                "busybox:latest": "sha256:'
-        '7968321274dc6b6171697c33df7815310468e694ac5be0ec03ff053bb135e768"\n'
-        '            }\n'
-        '        }, \n'
-        '        "path": "test_data/docker/image/aufs/repositories.json"\n'
-        '    }\n'
-        ']\n')
-    self.assertEqual(expected_string, result_string)
+    self.assertEqual(_EXPECTED_REPOSITORIES_AUFS, result_string)
 
   def testMakeMountCommands(self):
     """Tests the BaseStorage.MakeMountCommands function on a AuFS storage."""
     self.maxDiff = None
     container_obj = self.explorer_object.GetContainer(
-        '7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966')
+        _AUFS_CONTAINER_ID)
     commands = container_obj.storage_object.MakeMountCommands(
         container_obj, '/mnt')
     commands = [' '.join(x) for x in commands]
@@ -347,7 +560,7 @@ class TestAufsStorage(DockerTestCase):
     """Tests the BaseStorage.GetHistory function on a AuFS storage."""
     self.maxDiff = None
     container_obj = self.explorer_object.GetContainer(
-        '7b02fb3e8a665a63e32b909af5babb7d6ba0b64e10003b2d9534c7d5f2af8966')
+        _AUFS_CONTAINER_ID)
     expected = {
         'sha256:'
         '7968321274dc6b6171697c33df7815310468e694ac5be0ec03ff053bb135e768': {
@@ -394,8 +607,7 @@ class TestAufsV1Storage(DockerTestCase):
 
   def testGetAllContainers(self):
     """Tests the GetAllContainers function on a AuFS storage."""
-    containers_list = self.explorer_object.GetAllContainers()
-    containers_list = sorted(containers_list, key=lambda ci: ci.name)
+    containers_list = self.GetContainersSortedByName()
     self.assertEqual(3, len(containers_list))
 
     container_obj = containers_list[0]
@@ -407,13 +619,13 @@ class TestAufsV1Storage(DockerTestCase):
     self.assertTrue(container_obj.running)
 
     self.assertEqual(
-        'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c',
+        _AUFS_V1_CONTAINER_ID,
         container_obj.container_id)
 
   def testGetOrderedLayers(self):
     """Tests the BaseStorage.GetOrderedLayers function on a AuFS storage."""
     container_obj = self.explorer_object.GetContainer(
-        'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c')
+        _AUFS_V1_CONTAINER_ID)
     layers = container_obj.GetOrderedLayers()
     self.assertEqual(2, len(layers))
     self.assertEqual(
@@ -438,19 +650,20 @@ class TestAufsV1Storage(DockerTestCase):
     """Tests the GetContainersJson function on a AuFS storage."""
     result = self.explorer_object.GetContainersJson(only_running=True)
 
-    expected = collections.OrderedDict()
-    expected['image_name'] = 'busybox'
-    expected['container_id'] = 'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c'
-    expected['image_id'] = '1cee97b18f87b5fa91633db35f587e2c65c093facfa2cbbe83d5ebe06e1d9125'
-    expected['start_date'] = '2018-12-27T10:53:17.409426'
-    expected['log_path'] = '/var/lib/docker/containers/de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c/de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c-json.log'
+    expected = {
+        'image_name': 'busybox',
+        'container_id': _AUFS_V1_CONTAINER_ID,
+        'image_id': '1cee97b18f87b5fa91633db35f587e2c65c093facfa2cbbe83d5ebe06e1d9125',
+        'start_date': '2018-12-27T10:53:17.409426',
+        'log_path': '/var/lib/docker/containers/de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c/de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c-json.log'
+    }
 
     self.assertEqual([expected], result)
 
   def testGetLayerInfo(self):
     """Tests the BaseStorage.GetLayerInfo function on a AuFS storage."""
     container_obj = self.explorer_object.GetContainer(
-        'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c')
+        _AUFS_V1_CONTAINER_ID)
     layer_info = container_obj.GetLayerInfo(
         '1cee97b18f87b5fa91633db35f587e2c65c093facfa2cbbe83d5ebe06e1d9125')
     self.assertEqual('2018-12-26T08:20:42.831353376Z', layer_info['created'])
@@ -461,37 +674,22 @@ class TestAufsV1Storage(DockerTestCase):
     """Tests GetRepositoriesString() on a AuFS storage."""
     self.maxDiff = None
     result_string = self.explorer_object.GetRepositoriesString()
-    expected_string = (
-        '[\n'
-        '    {\n'
-        '        "Repositories": {\n'
-        '            "busybox": {\n'
-        '                "latest": "'
-        '1cee97b18f87b5fa91633db35f587e2c65c093facfa2cbbe83d5ebe06e1d9125"\n'
-        '            }\n'
-        '        }, \n'
-        '        "path": "test_data/docker/repositories-aufs"\n'
-        '    }\n'
-        ']\n')
-    self.assertEqual(expected_string, result_string)
+    self.assertEqual(_EXPECTED_REPOSITORIES_AUFS_V1, result_string)
 
   def testMakeMountCommands(self):
     """Tests the BaseStorage.MakeMountCommands function on a AuFS storage."""
     container_obj = self.explorer_object.GetContainer(
-        'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c')
+        _AUFS_V1_CONTAINER_ID)
     commands = container_obj.storage_object.MakeMountCommands(
         container_obj, '/mnt')
     commands = [' '.join(x) for x in commands]
     expected_commands = [
         (
-            '/bin/mount -t aufs -o ro,br=test_data/'
-            'docker/aufs/diff/'
-            'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c'
-            '=ro+wh none /mnt'),
+            '/bin/mount -t aufs -o ro,br=test_data/docker/aufs/diff/'
+            f'{_AUFS_V1_CONTAINER_ID}=ro+wh none /mnt'),
         (
             '/bin/mount -t aufs -o ro,remount,append:test_data/docker/aufs/diff/'
-            'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c'
-            '-init=ro+wh none /mnt'),
+            f'{_AUFS_V1_CONTAINER_ID}-init=ro+wh none /mnt'),
         (
             '/bin/mount -t aufs -o ro,remount,append:test_data/docker/aufs/diff/'
             '1cee97b18f87b5fa91633db35f587e2c65c093facfa2cbbe83d5ebe06e1d9125'
@@ -507,7 +705,7 @@ class TestAufsV1Storage(DockerTestCase):
     """Tests the BaseStorage.GetHistory function on a AuFS storage."""
     self.maxDiff = None
     container_obj = self.explorer_object.GetContainer(
-        'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c')
+        _AUFS_V1_CONTAINER_ID)
     expected = {
         '1cee97b18f87b5fa91633db35f587e2c65c093facfa2cbbe83d5ebe06e1d9125': {
             'size': 0
@@ -528,7 +726,7 @@ class TestAufsV1Storage(DockerTestCase):
   def testGetFullContainerID(self):
     """Tests the DockerExplorerTool._GetFullContainerID function on AuFS."""
     self.assertEqual(
-        'de44dd97cfd1c8d1c1aad7f75a435603991a7a39fa4f6b20a69bf4458809209c',
+        _AUFS_V1_CONTAINER_ID,
         self.explorer_object._GetFullContainerID('de44dd'))
 
     self.maxDiff = None
@@ -557,8 +755,7 @@ class TestOverlayStorage(DockerTestCase):
 
   def testGetAllContainers(self):
     """Tests the GetAllContainers function on a Overlay storage."""
-    containers_list = self.explorer_object.GetAllContainers()
-    containers_list = sorted(containers_list, key=lambda ci: ci.name)
+    containers_list = self.GetContainersSortedByName()
     self.assertEqual(6, len(containers_list))
 
     container_obj = containers_list[0]
@@ -570,13 +767,13 @@ class TestOverlayStorage(DockerTestCase):
     self.assertTrue(container_obj.running)
 
     self.assertEqual(
-        '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a',
+        _OVERLAY_CONTAINER_ID,
         container_obj.container_id)
 
   def testGetOrderedLayers(self):
     """Tests the BaseStorage.GetOrderedLayers function on a Overlay storage."""
     container_obj = self.explorer_object.GetContainer(
-        '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a')
+        _OVERLAY_CONTAINER_ID)
     layers = container_obj.GetOrderedLayers()
     self.assertEqual(1, len(layers))
     self.assertEqual(
@@ -603,21 +800,22 @@ class TestOverlayStorage(DockerTestCase):
     """Tests the GetContainersJson function on a Overlay storage."""
     result = self.explorer_object.GetContainersJson(only_running=True)
 
-    expected = collections.OrderedDict()
-    expected['image_name'] = 'busybox:latest'
-    expected['container_id'] = '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a'
-    expected['image_id'] = '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3'
-    expected['start_date'] = '2018-01-26T14:55:56.574924'
-    expected['mount_id'] = '974e2b994f9db74e1ddd6fc546843bc65920e786612a388f25685acf84b3fed1'
-    expected['upper_dir'] = 'test_data/docker/overlay/974e2b994f9db74e1ddd6fc546843bc65920e786612a388f25685acf84b3fed1/upper'
-    expected['log_path'] = '/var/lib/docker/containers/5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a/5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a-json.log'
+    expected = {
+        'image_name': 'busybox:latest',
+        'container_id': _OVERLAY_CONTAINER_ID,
+        'image_id': '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3',
+        'start_date': '2018-01-26T14:55:56.574924',
+        'mount_id': '974e2b994f9db74e1ddd6fc546843bc65920e786612a388f25685acf84b3fed1',
+        'upper_dir': 'test_data/docker/overlay/974e2b994f9db74e1ddd6fc546843bc65920e786612a388f25685acf84b3fed1/upper',
+        'log_path': '/var/lib/docker/containers/5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a/5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a-json.log'
+    }
 
     self.assertEqual([expected], result)
 
   def testGetLayerInfo(self):
     """Tests the BaseStorage.GetLayerInfo function on a Overlay storage."""
     container_obj = self.explorer_object.GetContainer(
-        '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a')
+        _OVERLAY_CONTAINER_ID)
     layer_info = container_obj.GetLayerInfo(
         'sha256:'
         '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3')
@@ -629,29 +827,12 @@ class TestOverlayStorage(DockerTestCase):
     """Tests GetRepositoriesString() on a Overlay storage."""
     result_string = self.explorer_object.GetRepositoriesString()
     self.maxDiff = None
-    expected_string = (
-        '[\n'
-        '    {\n'
-        '        "Repositories": {\n'
-        '            "busybox": {\n'
-        '                "busybox:latest": "sha256:'
-        '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3", \n'
-        '                "busybox@sha256:'
-        '1669a6aa7350e1cdd28f972ddad5aceba2912f589f19a090ac75b7083da748db": '
-        '"sha256:'
-        '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3"\n'
-        '            }\n'
-        '        }, \n'
-        '        "path": "test_data/docker/image/overlay/repositories.json"\n'
-        '    }\n'
-        ']\n')
-
-    self.assertEqual(expected_string, result_string)
+    self.assertEqual(_EXPECTED_REPOSITORIES_OVERLAY, result_string)
 
   def testMakeMountCommands(self):
     """Tests the BaseStorage.MakeMountCommands function on a Overlay storage."""
     container_obj = self.explorer_object.GetContainer(
-        '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a')
+        _OVERLAY_CONTAINER_ID)
     commands = container_obj.storage_object.MakeMountCommands(
         container_obj, '/mnt')
     commands = [' '.join(cmd) for cmd in commands]
@@ -668,7 +849,7 @@ class TestOverlayStorage(DockerTestCase):
     """Tests the BaseStorage.GetHistory function on a Overlay storage."""
     self.maxDiff = None
     container_obj = self.explorer_object.GetContainer(
-        '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a')
+        _OVERLAY_CONTAINER_ID)
     expected = {
         'sha256:'
         '5b0d59026729b68570d99bc4f3f7c31a2e4f2a5736435641565d93e7c25bd2c3': {
@@ -682,7 +863,7 @@ class TestOverlayStorage(DockerTestCase):
   def testGetFullContainerID(self):
     """Tests the DockerExplorerTool._GetFullContainerID function on Overlay."""
     self.assertEqual(
-        '5dc287aa80b460652a5584e80a5c8c1233b0c0691972d75424cf5250b917600a',
+        _OVERLAY_CONTAINER_ID,
         self.explorer_object._GetFullContainerID('5dc287aa80'))
 
     with self.assertRaises(Exception) as err:
@@ -709,8 +890,7 @@ class TestOverlay2Storage(DockerTestCase):
 
   def testGetAllContainers(self):
     """Tests the GetAllContainers function on a Overlay2 storage."""
-    containers_list = self.explorer_object.GetAllContainers()
-    containers_list = sorted(containers_list, key=lambda ci: ci.name)
+    containers_list = self.GetContainersSortedByName()
     self.assertEqual(5, len(containers_list))
 
     container_obj = containers_list[0]
@@ -721,7 +901,7 @@ class TestOverlay2Storage(DockerTestCase):
     self.assertEqual('busybox', container_obj.config_image_name)
     self.assertTrue(container_obj.running)
     self.assertEqual(
-        '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206',
+        _OVERLAY2_CONTAINER_ID,
         container_obj.container_id)
 
     container_obj = containers_list[3]
@@ -743,7 +923,7 @@ class TestOverlay2Storage(DockerTestCase):
     containers_list = sorted(containers_list, key=lambda ci: ci.name)
     self.assertEqual(4, len(containers_list))
     expected_containers = [
-        '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206',
+        _OVERLAY2_CONTAINER_ID,
         '9949fa153b778e39d6cab0a4e0ba60fa34a13fedb1f256d613a2f88c0c98408a',
         '10acac0b3466813c9e1f85e2aa7d06298e51fbfe86bbcb6b7a19dd33d3798f6a',
         '61ba4e6c012c782186c649466157e05adfd7caa5b551432de51043893cae5353']
@@ -753,7 +933,7 @@ class TestOverlay2Storage(DockerTestCase):
   def testGetOrderedLayers(self):
     """Tests the BaseStorage.GetOrderedLayers function on a Overlay2 storage."""
     container_obj = self.explorer_object.GetContainer(
-        '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206')
+        _OVERLAY2_CONTAINER_ID)
     layers = container_obj.GetOrderedLayers()
     self.assertEqual(1, len(layers))
     self.assertEqual(
@@ -780,21 +960,22 @@ class TestOverlay2Storage(DockerTestCase):
     """Tests the GetContainersJson function on a Overlay2 storage."""
     result = self.explorer_object.GetContainersJson(only_running=True)
 
-    expected = collections.OrderedDict()
-    expected['image_name'] = 'busybox'
-    expected['container_id'] = '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206'
-    expected['image_id'] = '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7'
-    expected['start_date'] = '2018-05-16T10:51:39.625989'
-    expected['mount_id'] = '92fd3b3e7d6101bb701743c9518c45b0d036b898c8a3d7cae84e1a06e6829b53'
-    expected['upper_dir'] = 'test_data/docker/overlay2/92fd3b3e7d6101bb701743c9518c45b0d036b898c8a3d7cae84e1a06e6829b53/diff'
-    expected['log_path'] = '/var/lib/docker/containers/8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206/8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206-json.log'
+    expected = {
+        'image_name': 'busybox',
+        'container_id': _OVERLAY2_CONTAINER_ID,
+        'image_id': '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7',
+        'start_date': '2018-05-16T10:51:39.625989',
+        'mount_id': '92fd3b3e7d6101bb701743c9518c45b0d036b898c8a3d7cae84e1a06e6829b53',
+        'upper_dir': 'test_data/docker/overlay2/92fd3b3e7d6101bb701743c9518c45b0d036b898c8a3d7cae84e1a06e6829b53/diff',
+        'log_path': '/var/lib/docker/containers/8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206/8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206-json.log'
+    }
 
     self.assertEqual([expected], result)
 
   def testGetLayerInfo(self):
     """Tests the BaseStorage.GetLayerInfo function on a Overlay2 storage."""
     container_obj = self.explorer_object.GetContainer(
-        '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206')
+        _OVERLAY2_CONTAINER_ID)
     layer_info = container_obj.GetLayerInfo(
         'sha256:'
         '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7')
@@ -806,33 +987,13 @@ class TestOverlay2Storage(DockerTestCase):
     """Tests GetRepositoriesString() on a Overlay2 storage."""
     result_string = self.explorer_object.GetRepositoriesString()
     self.maxDiff = None
-    expected_string = (
-        '[\n'
-        '    {\n'
-        '        "Repositories": {}, \n'
-        '        "path": "test_data/docker/image/overlay/repositories.json"\n'
-        '    }, \n'
-        '    {\n'
-        '        "Repositories": {\n'
-        '            "busybox": {\n'
-        '                "busybox:latest": "sha256:'
-        '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7", \n'
-        '                "busybox@sha256:'
-        '58ac43b2cc92c687a32c8be6278e50a063579655fe3090125dcb2af0ff9e1a64": '
-        '"sha256:'
-        '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7"\n'
-        '            }\n'
-        '        }, \n'
-        '        "path": "test_data/docker/image/overlay2/repositories.json"\n'
-        '    }\n'
-        ']\n')
-    self.assertEqual(expected_string, result_string)
+    self.assertEqual(_EXPECTED_REPOSITORIES_OVERLAY2, result_string)
 
   def testMakeMountCommands(self):
     """Tests the BaseStorage.MakeMountCommands function on Overlay2 storage."""
     self.maxDiff = None
     container_obj = self.explorer_object.GetContainer(
-        '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206')
+        _OVERLAY2_CONTAINER_ID)
     commands = container_obj.storage_object.MakeMountCommands(
         container_obj, '/mnt')
     commands = [' '.join(cmd) for cmd in commands]
@@ -848,7 +1009,7 @@ class TestOverlay2Storage(DockerTestCase):
     """Tests the BaseStorage.GetHistory function on a Overlay2 storage."""
     self.maxDiff = None
     container_obj = self.explorer_object.GetContainer(
-        '8e8b7f23eb7cbd4dfe7e91646ddd0e0f524218e25d50113559f078dfb2690206')
+        _OVERLAY2_CONTAINER_ID)
     expected = {
         'sha256:'
         '8ac48589692a53a9b8c2d1ceaa6b402665aa7fe667ba51ccc03002300856d8c7': {
@@ -959,41 +1120,12 @@ class TestDEVolumes(unittest.TestCase):
   def setUpClass(cls):
     """Internal method to set up the TestCase on a specific storage."""
     cls.driver = 'overlay2'
-    cls.docker_directory_path = os.path.join('test_data', 'docker')
-    if not os.path.isdir(cls.docker_directory_path):
-      docker_tar = os.path.join('test_data', 'vols.v2.tgz')
-      with tarfile.open(docker_tar, 'r:gz') as tar:
-        def is_within_directory(directory, target):
-            
-            abs_directory = os.path.abspath(directory)
-            abs_target = os.path.abspath(target)
-        
-            prefix = os.path.commonprefix([abs_directory, abs_target])
-            
-            return prefix == abs_directory
-        
-        def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-        
-            for member in tar.getmembers():
-                member_path = os.path.join(path, member.name)
-                if not is_within_directory(path, member_path):
-                    raise Exception("Attempted Path Traversal in Tar File")
-        
-            tar.extractall(path, members, numeric_owner=numeric_owner) 
-            
-        
-        safe_extract(tar, "test_data")
-        tar.close()
-    cls.explorer_object = explorer.Explorer()
-    cls.explorer_object.SetDockerDirectory(cls.docker_directory_path)
+    cls.docker_directory_path, cls.explorer_object = _GetExplorer(
+        'vols.v2.tgz')
 
     cls.driver_class = storage.Overlay2Storage
     cls.storage_version = 2
 
-  @classmethod
-  def tearDownClass(cls):
-    shutil.rmtree(cls.docker_directory_path)
-
   def testGenerateBindMountPoints(self):
     """Tests generating command to mount 'bind' MountPoints."""
     self.maxDiff = None
@@ -32,6 +32,22 @@ from tools.merge_vhdx import MergeVHDXTool
 
 # pylint: disable=protected-access
 
+VHDX_FILES_PATH = os.path.join('test_data', 'vhdx_files')
+
+
+def _ExtractVHDXFiles():
+  """Extracts the VHDX test files archive, if not already present.
+
+  Returns:
+    str: the path to the extracted vhdx_files directory.
+  """
+  if not os.path.isdir(VHDX_FILES_PATH):
+    vhdx_tar = os.path.join('test_data', 'vhdx_files.tgz')
+    with tarfile.open(vhdx_tar, 'r:gz') as tar:
+      tar.extractall('test_data')
+  return VHDX_FILES_PATH
+
+
 class BlockAllocationTableEntryTests(unittest.TestCase):
   """Tests for the BlockAllocationTableEntry subclasses"""
 
@@ -103,12 +119,7 @@ class VHDXDiskTests(unittest.TestCase):
 
   @classmethod
   def setUpClass(cls):
-    cls.vhdx_files_path = os.path.join('test_data', 'vhdx_files')
-    if not os.path.isdir(cls.vhdx_files_path):
-      vhdx_tar = os.path.join('test_data', 'vhdx_files.tgz')
-      tar = tarfile.open(vhdx_tar, 'r:gz')
-      tar.extractall('test_data')
-      tar.close()
+    cls.vhdx_files_path = _ExtractVHDXFiles()
     base_path = os.path.join(cls.vhdx_files_path, 'base.vhdx')
     diff_path = os.path.join(cls.vhdx_files_path, 'diff.vhdx')
     cls.base_disk = VHDXDisk(base_path)
@@ -171,12 +182,7 @@ class MergeVHDXToolTests(unittest.TestCase):
 
   @classmethod
   def setUpClass(cls):
-    cls.vhdx_files_path = os.path.join('test_data', 'vhdx_files')
-    if not os.path.isdir(cls.vhdx_files_path):
-      vhdx_tar = os.path.join('test_data', 'vhdx_files.tgz')
-      tar = tarfile.open(vhdx_tar, 'r:gz')
-      tar.extractall('test_data')
-      tar.close()
+    cls.vhdx_files_path = _ExtractVHDXFiles()
     cls.base_path = os.path.join(cls.vhdx_files_path, 'base.vhdx')
     cls.diff_path = os.path.join(cls.vhdx_files_path, 'diff.vhdx')
 